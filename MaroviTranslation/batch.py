@@ -0,0 +1,81 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from MaroviTranslation.converters.NeurIPS import NeurIPSPDFToSpanishMarkdown
+from MaroviTranslation.translation.core import Translator
+from MaroviTranslation.translation.GoogleTranslator import GoogleTranslator
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+def _process_one(args):
+    """Converts a single PDF to translated Markdown; runs in pool workers.
+
+    Parameters
+    ----------
+    args : tuple
+        (pdf_path, output_dir) pair.
+
+    Returns
+    -------
+    dict
+        Manifest entry with the input path, output paths, and any error.
+    """
+    pdf_path, output_dir = args
+    try:
+        translator = Translator()
+        translator.set_translator(GoogleTranslator())
+        converter = NeurIPSPDFToSpanishMarkdown(pdf_path, output_dir, translator)
+        converter.parse_pdf()
+        converter.create_image_map()
+        converter.generate_markdown()
+        return {"pdf": pdf_path, "markdown_en": converter.output_md_en,
+                "markdown_es": converter.output_md_es, "error": None}
+    except Exception as error:
+        # One bad paper should not sink the rest of the corpus
+        return {"pdf": pdf_path, "markdown_en": None, "markdown_es": None,
+                "error": str(error)}
+
+def process_corpus(pdf_paths, output_dir, num_workers=None):
+    """Converts a corpus of PDFs in parallel, one file per worker.
+
+    Whole files are the natural parallelism axis for a folder of papers:
+    each conversion is an independent parse-translate-render job, so wall
+    time scales near-linearly with cores up to translator rate limits.
+
+    Parameters
+    ----------
+    pdf_paths : list
+        Paths of the PDF files to convert.
+    output_dir : str
+        Directory for the generated Markdown files and images.
+    num_workers : int, optional
+        Number of worker processes, by default os.cpu_count().
+
+    Returns
+    -------
+    list
+        Manifest entries, one per input PDF in input order. The manifest is
+        also written to manifest.json in the output directory.
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    jobs = [(pdf_path, output_dir) for pdf_path in pdf_paths]
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        results = executor.map(_process_one, jobs)
+        if tqdm is not None:
+            results = tqdm(results, total=len(jobs))
+        manifest = list(results)
+
+    # Written once from the parent after the pool drains; simpler than
+    # append-with-a-lock from the workers and just as fast
+    with open(os.path.join(output_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
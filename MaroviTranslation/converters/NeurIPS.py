@@ -1,8 +1,18 @@
+import functools
 import os
 import re
 from MaroviTranslation.parsing.NeurIPSParser import NeurIPSParser
 from MaroviTranslation.markdown.core import Markdown
 
+# Translation table mapping newlines to spaces; str.translate with a prebuilt
+# table is a single pass without the substring-replace machinery
+_NL2SP = str.maketrans('\n', ' ')
+
+def _md_image_to_html(match, width):
+    """Rewrites a Markdown image match into an HTML img tag with a width."""
+    alt_text, img_src = match.groups()
+    return f'\n<img src="{img_src}" alt="{alt_text}" width="{width}px">\n'
+
 class NeurIPSPDFToSpanishMarkdown:
     """Class to convert a NeurIPS PDF to a Spanish Markdown file.
 
@@ -24,10 +34,13 @@ class NeurIPSPDFToSpanishMarkdown:
         Path to the output English Markdown file.
     output_md_es : str
         Path to the output Spanish Markdown file.
+    image_md : list
+        Positional list of Markdown image strings, one per extracted image.
     image_map : dict
-        Dictionary mapping image tags to image paths.
-    pattern : str   
-        Regex pattern for image tags.
+        Dictionary mapping image tags to image paths, kept for callers that
+        still expect the tag-keyed form.
+    pattern : re.Pattern
+        Compiled regex pattern for image tags.
     """
     def __init__(self, pdf_path, output_dir, translator):
         self.pdf_path = pdf_path
@@ -38,22 +51,34 @@ class NeurIPSPDFToSpanishMarkdown:
         self.image_dir_relative = f"{self.project_name}_images"
         self.output_md_en = os.path.join(output_dir, f"{self.project_name}_en.md")
         self.output_md_es = os.path.join(output_dir, f"{self.project_name}_es.md")
+        self.image_md = []
         self.image_map = {}
-        self.pattern = r"<image: .+?>|<Imagen: .+?>"
+        # Compiled once so per-section substitutions skip the regex cache
+        self.pattern = re.compile(r"<image: .+?>|<Imagen: .+?>")
+        self.md_image_pattern = re.compile(r'!\[(.*?)\]\((.*?)\)')
+        # Memoizes translations so repeated strings (e.g. recurring titles)
+        # only hit the translation API once per document
+        self._tcache = {}
 
         if not os.path.exists(self.image_dir):
             os.makedirs(self.image_dir)
 
     def parse_pdf(self):
-        """Parses the PDF file and extracts the images."""
-        parser = NeurIPSParser(self.pdf_path)
+        """Parses the PDF file and extracts the images in a single pass."""
+        parser = NeurIPSParser(self.pdf_path, self.image_dir, self.image_dir_relative)
         self.sections = parser.sections
-        self.image_paths = parser.extract_images(self.image_dir, self.image_dir_relative)
+        self.image_paths = parser.image_paths
         parser.close()
 
     def create_image_map(self):
-        """Creates a dictionary mapping image tags to image paths."""
-        self.image_map = {f'image_{i}': f'![Image {i}]({path})' for i, path in enumerate(self.image_paths)}
+        """Creates the positional list of Markdown image strings.
+
+        Image tags are replaced in extraction order, so a plain list indexed
+        by the running image counter replaces the old 'image_N'-keyed dict
+        and its per-image string formatting and hashing.
+        """
+        self.image_md = [f'![Image {i}]({path})' for i, path in enumerate(self.image_paths)]
+        self.image_map = {f'image_{i}': md for i, md in enumerate(self.image_md)}
 
     def convert_images_to_html_with_width(self, text, width=300):
         """Converts image tags to HTML tags with a specified width.
@@ -70,20 +95,134 @@ class NeurIPSPDFToSpanishMarkdown:
         str
             Converted text.
         """
-        def replace_md_with_html(match):
-            alt_text, img_src = match.groups()
-            return f'\n<img src="{img_src}" alt="{alt_text}" width="{width}px">\n'
+        # Cheap substring test skips the regex engine for text-only sections
+        if '![' not in text:
+            return text
+
+        return self.md_image_pattern.sub(
+            functools.partial(_md_image_to_html, width=width), text)
+
+    def replace_image_tags_with_html(self, text, markdown, width=300):
+        """Replaces image tags with HTML img tags in a single pass.
+
+        Fuses replace_image_tags and convert_images_to_html_with_width so each
+        section body is scanned by the regex engine once instead of twice,
+        without materializing the intermediate Markdown-image string.
+
+        Parameters
+        ----------
+        text : str
+            Text containing image tags.
+        markdown : Markdown
+            Markdown document whose image counter tracks the next image.
+        width : int
+            Width of the images.
+
+        Returns
+        -------
+        str
+            Text with image tags replaced by HTML img tags.
+        """
+        def replace_func(match):
+            index = markdown.image_counter
+            markdown.image_counter += 1
+            if index < len(self.image_paths):
+                return f'\n<img src="{self.image_paths[index]}" alt="Image {index}" width="{width}px">\n'
+            return ""
+        return self.pattern.sub(replace_func, text)
 
-        pattern = r'!\[(.*?)\]\((.*?)\)'
-        return re.sub(pattern, replace_md_with_html, text)
+    def _tr(self, text):
+        """Translates text through the in-memory translation cache.
+
+        Parameters
+        ----------
+        text : str
+            Text to translate.
+
+        Returns
+        -------
+        str
+            Translated text, or the original text if translation returns
+            nothing. Empty input is returned as is.
+        """
+        if not text:
+            return ""
+        translated = self._tcache.get(text)
+        if translated is None:
+            translated = self.translator.translate(text) or text
+            self._tcache[text] = translated
+        return translated
+
+    def iter_sections(self):
+        """Yields (title, section_data) pairs, parsing the PDF on demand.
+
+        Yields
+        ------
+        tuple
+            Section title and body, in document order.
+        """
+        if not hasattr(self, 'sections'):
+            self.parse_pdf()
+        yield from self.sections
+
+    def stream_markdown(self):
+        """Generates the Markdown files one section at a time.
+
+        Unlike generate_markdown, which batches the whole document through
+        the translator before rendering, this path translates and writes each
+        section as it is produced, so peak memory stays at one section rather
+        than several full copies of the document. generate_markdown remains
+        the faster choice over the network; use this for very large papers.
+        """
+        markdown_en = Markdown()
+        markdown_es = Markdown()
+
+        with open(self.output_md_en, 'w', buffering=1 << 20) as out_en, \
+                open(self.output_md_es, 'w', buffering=1 << 20) as out_es:
+            for title, section_data in self.iter_sections():
+                spanish_title = self._tr(title) or title
+                level = title.count('.') + 2
+                out_en.write(f"{'#' * level} {title}\n\n")
+                out_es.write(f"{'#' * level} {spanish_title}\n\n")
+
+                if section_data:
+                    section_data = section_data.translate(_NL2SP)
+                    section_data_en = self.replace_image_tags_with_html(section_data, markdown_en)
+                    out_en.write(f"{section_data_en}\n\n")
+
+                    translated_data = self._tr(section_data)
+                    if translated_data == section_data:
+                        section_data_es = section_data_en
+                        markdown_es.image_counter = markdown_en.image_counter
+                    else:
+                        section_data_es = self.replace_image_tags_with_html(translated_data, markdown_es)
+                    out_es.write(f"{section_data_es}\n\n")
 
     def generate_markdown(self):
         """Generates the Markdown files."""
         markdown_en = Markdown()
         markdown_es = Markdown()
 
+        # Collect every title and section body up front so the translator is
+        # hit with one batched call instead of a round-trip per section
+        payload = []
         for title, section_data in self.sections:
-            spanish_title = self.translator.translate(title)
+            payload.append(title)
+            payload.append((section_data or "").translate(_NL2SP))
+
+        # Only strings not already in the cache are sent to the API; the
+        # results fan back out through the cache below
+        pending = list(dict.fromkeys(
+            text for text in payload if text and text not in self._tcache))
+        # strict zip: a backend returning fewer results than inputs must
+        # raise here rather than render empty sections downstream
+        for text, result in zip(pending, self.translator.translate_batch(pending),
+                                strict=True):
+            self._tcache[text] = result or text
+        translated = [self._tcache.get(text, "") for text in payload]
+
+        for i, (title, section_data) in enumerate(self.sections):
+            spanish_title = translated[2 * i]
             if not spanish_title:
                 spanish_title = title
 
@@ -92,13 +231,19 @@ class NeurIPSPDFToSpanishMarkdown:
             markdown_es.add_title(spanish_title, level=num_periods+2)
 
             if section_data:
-                section_data = section_data.replace('\n', ' ')
-                section_data_en = self.convert_images_to_html_with_width(
-                    markdown_en.replace_image_tags(section_data, self.image_map, self.pattern))
+                section_data = payload[2 * i + 1]
+                translated_data = translated[2 * i + 1]
+                section_data_en = self.replace_image_tags_with_html(section_data, markdown_en)
                 markdown_en.add_text(section_data_en)
 
-                section_data_es = self.convert_images_to_html_with_width(
-                    markdown_es.replace_image_tags(self.translator.translate(section_data), self.image_map, self.pattern))
+                if translated_data == section_data:
+                    # No-op translation (e.g. formulas or code): reuse the
+                    # rendered English output and keep the Spanish image
+                    # counter in step instead of re-running the regex pass
+                    section_data_es = section_data_en
+                    markdown_es.image_counter = markdown_en.image_counter
+                else:
+                    section_data_es = self.replace_image_tags_with_html(translated_data, markdown_es)
                 markdown_es.add_text(section_data_es)
 
         markdown_en.save_markdown(self.output_md_en)
@@ -1,8 +1,17 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TextIO
 
+import io
 import re
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once at import so from_markdown does not hit the regex cache per line
+_IMG_RE = re.compile(r'!\[(.*?)\]\((.*?)\)')
+
 class ContentElement:
     """
     Represents a content element in a document, such as a paragraph or an image.
@@ -138,20 +147,34 @@ class Section:
         Returns:
             str: A string representing the Section in Markdown format.
         """
+        buffer = io.StringIO()
+        self.write_markdown(buffer, level=level, section_number=section_number)
+        return buffer.getvalue()
+
+    def write_markdown(self, fp: TextIO, level: int = 1, section_number: str = '') -> None:
+        """
+        Writes the Section and its subsections as Markdown to a file-like object.
+
+        Streaming section-by-section avoids materializing the whole rendered
+        document in memory the way to_markdown does.
+
+        Args:
+            fp (TextIO): The writable file-like object to stream Markdown into.
+            level (int): The heading level for this section. Default is 1.
+            section_number (str): The section number for this section (e.g., '1.2.5'). Default is ''.
+        """
         # Construct the heading for the section, with optional section numbering
         heading = f"{self.title}"
-        md = f"{'#' * level} {heading}\n"
+        fp.write(f"{'#' * level} {heading}\n")
 
         # Add content elements
         for elem in self.content:
-            md += elem.to_markdown()
+            fp.write(elem.to_markdown())
 
         # Add subsections, recursively incrementing the heading level and section numbering
         for index, sub in enumerate(self.subsections, start=1):
             sub_section_number = f"{section_number}{index}." if section_number else f"{index}."
-            md += sub.to_markdown(level=level + 1, section_number=sub_section_number)
-        
-        return md
+            sub.write_markdown(fp, level=level + 1, section_number=sub_section_number)
 
     def __repr__(self) -> str:
         """
@@ -162,43 +185,6 @@ class Section:
         """
         return f"Section(title={self.title!r}, content={len(self.content)} elements, subsections={len(self.subsections)})"
 
-class Document:
-    def __init__(self):
-        self.sections = []
-
-    def add_section(self, section):
-        self.sections.append(section)
-
-    def to_json(self):
-        return [section.to_json() for section in self.sections]
-
-    def to_markdown(self):
-        return ''.join(section.to_markdown() for section in self.sections)
-
-    def save_as_json(self, filename):
-        with open(filename, 'w') as f:
-            json.dump(self.to_json(), f, indent=2)
-
-    @staticmethod
-    def load_from_json(filename):
-        with open(filename, 'r') as f:
-            data = json.load(f)
-        return Document.from_json(data)
-
-    @staticmethod
-    def from_json(json_data):
-        doc = Document()
-        for section_data in json_data:
-            section = Section(section_data['title'])
-            for content_data in section_data['content']:
-                elem = ContentElement(**content_data)
-                section.add_content(elem)
-            for title, sub_data in section_data.get('subsections', {}).items():
-                subsection = Section.from_json(sub_data)
-                section.add_subsection(title, subsection)
-            doc.add_section(section)
-        return doc
-
 class Document:
     """
     Represents a complete document, containing multiple sections.
@@ -238,17 +224,56 @@ class Document:
         Returns:
             str: A string representing the Document in Markdown format.
         """
-        return ''.join(section.to_markdown() for section in self.sections)
+        buffer = io.StringIO()
+        self.write_markdown(buffer)
+        return buffer.getvalue()
+
+    def write_markdown(self, fp: TextIO) -> None:
+        """
+        Writes the Document as Markdown to a file-like object, section by section.
+
+        Args:
+            fp (TextIO): The writable file-like object to stream Markdown into.
+        """
+        for section in self.sections:
+            section.write_markdown(fp, level=1)
+
+    def save_markdown(self, filename: str) -> None:
+        """
+        Saves the Document as a Markdown file.
+
+        Sections are streamed into a buffered writer, so peak memory stays at
+        one section rather than the full rendered document.
+
+        Args:
+            filename (str): The name of the file to save the Markdown to.
+        """
+        with open(filename, 'w', buffering=1 << 20) as f:
+            self.write_markdown(f)
 
     def save_as_json(self, filename: str) -> None:
         """
         Saves the Document as a JSON file.
 
+        Uses orjson's C-level encoder when the optional dependency is
+        installed; otherwise sections are serialized one at a time so the
+        stdlib encoder never walks a second full copy of the document.
+
         Args:
             filename (str): The name of the file to save the JSON data to.
         """
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.to_json(), option=orjson.OPT_INDENT_2))
+            return
+
         with open(filename, 'w') as f:
-            json.dump(self.to_json(), f, indent=2)
+            f.write('[\n')
+            for index, section in enumerate(self.sections):
+                if index:
+                    f.write(',\n')
+                json.dump(section.to_json(), f, indent=2)
+            f.write('\n]')
 
     @staticmethod
     def load_from_json(filename: str) -> 'Document':
@@ -333,10 +358,14 @@ class Document:
         for line in lines:
             line = line.strip()
 
-            # Match headings (sections and subsections)
-            if line.startswith('#'):
-                level = len(line) - len(line.lstrip('#'))
-                title = line.lstrip('#').strip()
+            # Match headings (sections and subsections); leading '#' are
+            # counted by index so no throwaway lstrip strings are allocated
+            if line[:1] == '#':
+                level = 1
+                line_length = len(line)
+                while level < line_length and line[level] == '#':
+                    level += 1
+                title = line[level:].strip()
 
                 # Create a new section or subsection based on heading level
                 new_section = Section(title)
@@ -352,9 +381,9 @@ class Document:
                     section_stack[-1].add_subsection(current_subsection)
                     section_stack.append(current_subsection)
             
-            # Match image elements
-            elif re.match(r'!\[.*\]\(.*\)', line):
-                match = re.match(r'!\[(.*?)\]\((.*?)\)', line)
+            # Match image elements; a single capturing match both detects the
+            # line and supplies the groups, so the line is only scanned once
+            elif (match := _IMG_RE.match(line)):
                 description, path = match.groups()
                 content_element = ContentElement(
                     element_type='image',
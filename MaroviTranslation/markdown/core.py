@@ -1,4 +1,3 @@
-import markdown2 as md2
 import os
 import re
 
@@ -10,9 +9,16 @@ class Markdown:
         content : str
             Markdown content.
         """
-        self.content = ""
+        # Content is buffered as a list of fragments and joined once on save,
+        # avoiding quadratic string concatenation on long documents
+        self._parts = []
         self.image_counter = 0
 
+    @property
+    def content(self):
+        """str : Markdown content accumulated so far."""
+        return "".join(self._parts)
+
     def add_title(self, title, level=1):
         """Adds a title to the Markdown file.
         Parameters
@@ -22,7 +28,7 @@ class Markdown:
         level : int
             Title level, from 1 to 6.
         """
-        self.content += f"{'#' * level} {title}\n\n"
+        self._parts.append(f"{'#' * level} {title}\n\n")
 
     def add_image(self, image_path, alt_text=""):
         """Adds an image to the Markdown file.
@@ -41,7 +47,7 @@ class Markdown:
         """
         if not os.path.exists(image_path):
             raise FileNotFoundError(f"Image not found: {image_path}")
-        self.content += f"![{alt_text}]({image_path})"
+        self._parts.append(f"![{alt_text}]({image_path})")
 
     def add_equation(self, equation):
         """Adds an equation to the Markdown file.
@@ -51,7 +57,7 @@ class Markdown:
         equation : str
             LaTeX equation string.
         """
-        self.content += f"$$\n{equation}\n$$\n\n"
+        self._parts.append(f"$$\n{equation}\n$$\n\n")
 
     def add_text(self, text, image_map=None, pattern=None):
         """Adds text to the Markdown file.
@@ -65,7 +71,7 @@ class Markdown:
         """
         if image_map:
             text = self.replace_image_tags(text, image_map, pattern)
-        self.content += f"{text}\n\n"
+        self._parts.append(f"{text}\n\n")
 
     def replace_image_tags(self, text, image_map, pattern):
         """Replaces image tags with Markdown image syntax.
@@ -74,21 +80,28 @@ class Markdown:
         ----------
         text : str
             Text to replace image tags in.
-        image_map : dict
-            Map of image tags to Markdown image syntax.
+        image_map : list or dict
+            Positional list of Markdown image strings, indexed by the running
+            image counter. A dict keyed by 'image_N' tags is also accepted
+            for backwards compatibility.
         pattern : str
             Regular expression pattern to match image tags.
-            
+
         Returns
         -------
         str
             Text with image tags replaced.
         """
-        def replace_func(match):
-            img_tag = f'image_{self.image_counter}'
-            self.image_counter += 1  # Increment the counter after each match
-            return image_map.get(img_tag, "")
-        return re.sub(pattern, replace_func, text)
+        if isinstance(image_map, dict):
+            image_map = list(image_map.values())
+
+        # Iterate from the current counter with a local iterator so each
+        # match costs one next() instead of two instance-attribute accesses
+        # and a bounds check; subn reports how far the counter advanced
+        images = iter(image_map[self.image_counter:])
+        result, count = re.subn(pattern, lambda match: next(images, ""), text)
+        self.image_counter += count
+        return result
     
     def save_markdown(self, filename):
         """Saves the Markdown file.
@@ -98,5 +111,7 @@ class Markdown:
         filename : str
             Path to save Markdown file to.
         """
-        with open(filename, 'w') as file:
-            file.write(self.content)
\ No newline at end of file
+        # writelines streams the buffered fragments through a large writer
+        # buffer instead of joining them into one giant string first
+        with open(filename, 'w', buffering=1 << 20) as file:
+            file.writelines(self._parts)
\ No newline at end of file
@@ -1,5 +1,89 @@
 import re
-from .core import PDFParser
+from operator import itemgetter
+
+from .core import PDFParser, _parse_section
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Compiled once at import so repeated parses skip the per-call pattern lookup
+_SECTION_RE = re.compile(r'\n(\d+(\.\d+)*)\s*([A-Za-z][^\n.]*)?(\n[^\n\d]+)?')
+
+# Optional Hyperscan database for the same pattern. Hyperscan scans the whole
+# buffer in a single linear pass instead of Python-level backtracking, so it
+# wins on long PDF texts; groups are recovered afterwards with _SECTION_RE.
+_SECTION_DB = None
+if hyperscan is not None:
+    try:
+        _SECTION_DB = hyperscan.Database()
+        _SECTION_DB.compile(
+            expressions=[_SECTION_RE.pattern.encode('utf-8')],
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+        )
+    except Exception:
+        # Hyperscan is only an accelerator: if the installed build cannot
+        # compile the pattern, scan with the Python regex instead of making
+        # the module unimportable
+        _SECTION_DB = None
+
+def _matches_from_starts(text, starts):
+    """Recovers full regex matches from candidate match start offsets.
+
+    Parameters
+    ----------
+    text : str
+        Full text of the PDF.
+    starts : iterable
+        Candidate match start offsets reported by a byte-level scan.
+
+    Returns
+    -------
+    list
+        List of re.Match objects, leftmost and non-overlapping as with
+        finditer.
+    """
+    matches = []
+    last_end = -1
+    for start in sorted(set(starts)):
+        # Skip candidates inside an already accepted match to mirror
+        # finditer's non-overlapping semantics
+        if start < last_end:
+            continue
+        match = _SECTION_RE.match(text, start)
+        if match:
+            matches.append(match)
+            last_end = match.end()
+    return matches
+
+def _iter_section_matches(text):
+    """Finds section heading matches in text.
+
+    Uses Hyperscan for the scan when the optional binding is installed. The
+    fast path requires plain ASCII text (so byte offsets equal character
+    offsets); anything else falls back to the precompiled Python regex.
+
+    Parameters
+    ----------
+    text : str
+        Full text of the PDF.
+
+    Returns
+    -------
+    list
+        List of re.Match objects, leftmost and non-overlapping as with finditer.
+    """
+    if _SECTION_DB is not None:
+        data = text.encode('utf-8')
+        if len(data) == len(text):
+            spans = []
+            def on_match(match_id, start, end, flags, context):
+                spans.append(start)
+            _SECTION_DB.scan(data, match_event_handler=on_match)
+            return _matches_from_starts(text, spans)
+
+    return list(_SECTION_RE.finditer(text))
 
 class NeurIPSParser(PDFParser):
     """Class to parse NeurIPS PDF files. Inherits from PDFParser.
@@ -13,23 +97,39 @@ class NeurIPSParser(PDFParser):
         PDF document.
     sections : list
         List of sections in the PDF file.
+    image_paths : list
+        List of extracted image paths. Only set when image directories are
+        passed to the constructor.
     """
-    def __init__(self, file_path):
+    def __init__(self, file_path, image_dir=None, image_dir_relative=None):
         super().__init__(file_path)
-        self.sections = self.extract_sections()
-
-    def extract_sections(self):
+        if image_dir is not None:
+            # Pull text and images in one pass over the pages instead of
+            # traversing the document once for each
+            text, self.image_paths = self.extract_text_and_images(
+                image_dir, image_dir_relative)
+            self.sections = self.extract_sections(text)
+        else:
+            self.sections = self.extract_sections()
+
+    def extract_sections(self, text=None):
         """Extracts sections from PDF file.
 
+        Parameters
+        ----------
+        text : str, optional
+            Pre-extracted text of the PDF, e.g. from a fused text-and-image
+            pass. Extracted from the document when not given.
+
         Returns
         -------
         list
             List of sections in the PDF file. Each section is a list with the section title
             as the first element and the section content as the second element.
         """
-        text = self.extract_text()
-        pattern = r'\n(\d+(\.\d+)*)\s*([A-Za-z][^\n.]*)?(\n[^\n\d]+)?'
-        matches = list(re.finditer(pattern, text))
+        if text is None:
+            text = self.extract_text()
+        matches = _iter_section_matches(text)
 
         # Filter and process sections
         filtered_sections = []
@@ -55,13 +155,18 @@ class NeurIPSParser(PDFParser):
             section_content = text[start_content:end_content].strip()
 
             full_title = f"{section_number} {section_title}"
-            #Remove first two lines since they are the title
-            section_content = section_content.split('\n', 2)[2:]
-            section_content = '\n'.join(section_content)
+            #Remove first two lines since they are the title; find + slice
+            #avoids the intermediate list and join of split('\n', 2)
+            cut = section_content.find('\n')
+            if cut != -1:
+                cut = section_content.find('\n', cut + 1)
+            section_content = section_content[cut + 1:] if cut != -1 else ''
             extracted_sections.append([full_title, section_content])
 
         #For last section, remove all lines following "References"
-        extracted_sections[-1][1] = extracted_sections[-1][1].split("\nReferences")[0]
+        references = extracted_sections[-1][1].find("\nReferences")
+        if references != -1:
+            extracted_sections[-1][1] = extracted_sections[-1][1][:references]
 
         return extracted_sections
 
@@ -79,8 +184,17 @@ class NeurIPSParser(PDFParser):
         list
             Filtered and ordered list of section tuples.
         """
+        # Decorate each entry with a precomputed tuple key instead of building
+        # a list key per element inside the sort; tuples compare faster and
+        # the section numbers are only split once
+        decorated = [
+            (_parse_section(num), num, title, start, end)
+            for num, title, start, end in sections_with_spans
+        ]
+        decorated.sort(key=itemgetter(0))
+
         valid_sections = []
-        for num, title, start, end in sorted(sections_with_spans, key=lambda x: [int(part) for part in x[0].split('.')]):
+        for _, num, title, start, end in decorated:
             if not valid_sections:
                 valid_sections.append((num, title, start, end))
             else:
@@ -1,6 +1,29 @@
+import asyncio
+import inspect
+import threading
+
 import googletrans as gt
 from .core import Translator
 
+# googletrans accepts a list of strings per request; chunking keeps each
+# request under the service's size cap
+_BATCH_SIZE = 50
+
+# All GoogleTranslator instances share one googletrans client, so the
+# underlying HTTP connection pool and TLS session are reused across calls
+# instead of being rebuilt per instance
+_SHARED_CLIENT = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+def _get_shared_client():
+    """Returns the lazily created process-wide googletrans client."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        with _SHARED_CLIENT_LOCK:
+            if _SHARED_CLIENT is None:
+                _SHARED_CLIENT = gt.Translator()
+    return _SHARED_CLIENT
+
 class GoogleTranslator(Translator):
     """Class to translate text from one language to another using googletrans library
     Attributes
@@ -14,7 +37,7 @@ class GoogleTranslator(Translator):
     """
     def __init__(self):
         super().__init__()
-        self.translator = gt.Translator()
+        self.translator = _get_shared_client()
 
     def translate(self, text):
         """Translates text from one language to another.
@@ -30,4 +53,78 @@ class GoogleTranslator(Translator):
         """
         translation = self.translator.translate(text, src=self.src_lang, dest=self.dest_lang)
         return translation.text
-    
\ No newline at end of file
+
+    def translate_batch(self, texts):
+        """Translates a list of texts using multi-text requests.
+
+        googletrans takes a list per call and returns a list of translations
+        from a single round-trip, so N texts cost ceil(N / 50) requests
+        instead of N.
+
+        Parameters
+        ----------
+        texts : list
+            Texts to translate.
+
+        Returns
+        -------
+        list
+            Translated texts, in the same order as the input.
+        """
+        translated = []
+        for start in range(0, len(texts), _BATCH_SIZE):
+            chunk = texts[start:start + _BATCH_SIZE]
+            results = self.translator.translate(chunk, src=self.src_lang, dest=self.dest_lang)
+            translated.extend(result.text for result in results)
+        return translated
+
+    async def translate_async(self, text):
+        """Translates text without blocking the event loop.
+
+        Works with both the async googletrans 4.x client and the synchronous
+        release-candidate client, which is run in a worker thread.
+
+        Parameters
+        ----------
+        text : str
+            Text to translate.
+
+        Returns
+        -------
+        str
+            Translated text.
+        """
+        translate = self.translator.translate
+        if inspect.iscoroutinefunction(translate):
+            result = await translate(text, src=self.src_lang, dest=self.dest_lang)
+        else:
+            result = await asyncio.to_thread(
+                translate, text, src=self.src_lang, dest=self.dest_lang)
+        return result.text
+
+    async def translate_many(self, texts, concurrency=10):
+        """Translates texts concurrently, bounded by a semaphore.
+
+        Fires all requests through asyncio.gather with at most `concurrency`
+        in flight, so wall time drops from N round-trips to roughly
+        ceil(N / concurrency).
+
+        Parameters
+        ----------
+        texts : list
+            Texts to translate.
+        concurrency : int
+            Maximum number of requests in flight at once, by default 10.
+
+        Returns
+        -------
+        list
+            Translated texts, in the same order as the input.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def translate_one(text):
+            async with semaphore:
+                return await self.translate_async(text)
+
+        return list(await asyncio.gather(*(translate_one(text) for text in texts)))
@@ -1,3 +1,13 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Number of concurrent translation requests used when the wrapped API has no
+# native batch endpoint
+_MAX_WORKERS = int(os.environ.get('MAROVI_TRANSLATE_WORKERS', '8'))
+
 class Translator:
     """Class to translate text, parent class to use with different translation APIs.
     Attributes
@@ -8,11 +18,35 @@ class Translator:
         Source language.
     dest_lang : str
         Destination language.
+    cache_path : str
+        Path of the on-disk translation cache. Set to None to disable
+        persistent caching.
     """
     def __init__(self):
         self.translator = None
         self.src_lang = 'en'
         self.dest_lang = 'es'
+        # Persistent translation memory so re-runs over the same document
+        # cost a lookup instead of a network round-trip; opened lazily
+        self.cache_path = os.path.expanduser('~/.marovi/trans_cache.db')
+        self._cache_db = None
+        self._cache_lock = threading.Lock()
+
+    def _cache(self):
+        """Returns the on-disk cache connection, creating it on first use."""
+        if self._cache_db is None:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            # The connection is shared across the translate_batch worker
+            # threads; _cache_lock serializes access to it
+            self._cache_db = sqlite3.connect(self.cache_path, check_same_thread=False)
+            self._cache_db.execute(
+                'CREATE TABLE IF NOT EXISTS translations (key BLOB PRIMARY KEY, text TEXT)')
+        return self._cache_db
+
+    def _cache_key(self, text):
+        """Builds the cache key for a text in the current language pair."""
+        payload = f"{self.src_lang}|{self.dest_lang}|{text}"
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
 
     def set_translator(self, translator):
         """Set translator object from translation API.
@@ -25,6 +59,11 @@ class Translator:
 
     def translate(self, text):
         """Translate text from source language to destination language.
+
+        Results are stored in the on-disk cache keyed by language pair and
+        text hash, so re-translating the same text — including across runs —
+        skips the API call.
+
         Parameters
         ----------
         text : str
@@ -36,7 +75,81 @@ class Translator:
         """
         if self.translator is None:
             raise NotImplementedError('Translator not implemented')
-    
-        return self.translator.translate(text)
-    
-    
\ No newline at end of file
+
+        if self.cache_path is None:
+            return self.translator.translate(text)
+
+        key = self._cache_key(text)
+        with self._cache_lock:
+            row = self._cache().execute(
+                'SELECT text FROM translations WHERE key = ?', (key,)).fetchone()
+        if row is not None:
+            return row[0]
+
+        result = self.translator.translate(text)
+        if isinstance(result, str):
+            with self._cache_lock:
+                self._cache().execute(
+                    'INSERT OR REPLACE INTO translations VALUES (?, ?)', (key, result))
+                self._cache_db.commit()
+        return result
+
+    def translate_batch(self, texts):
+        """Translate a list of texts in as few round-trips as possible.
+
+        Delegates to the wrapped translator's own translate_batch when it has
+        one, so API wrappers with a true batch endpoint collapse the whole
+        list into a single request. The batch path goes through the on-disk
+        cache like translate does: cached texts are filled in locally and
+        only the misses are sent to the API. Otherwise the per-text requests
+        are dispatched concurrently on a thread pool, since each one blocks
+        on network I/O. Worker count is tunable via MAROVI_TRANSLATE_WORKERS.
+
+        Parameters
+        ----------
+        texts : list
+            Texts to translate. Empty strings are passed through untranslated.
+
+        Returns
+        -------
+        list
+            Translated texts, in the same order as the input.
+        """
+        if self.translator is not None and hasattr(self.translator, 'translate_batch'):
+            if self.cache_path is None:
+                return self.translator.translate_batch(texts)
+
+            results = [None] * len(texts)
+            miss_indices = []
+            with self._cache_lock:
+                cache = self._cache()
+                for i, text in enumerate(texts):
+                    row = cache.execute(
+                        'SELECT text FROM translations WHERE key = ?',
+                        (self._cache_key(text),)).fetchone()
+                    if row is not None:
+                        results[i] = row[0]
+                    else:
+                        miss_indices.append(i)
+
+            if miss_indices:
+                misses = [texts[i] for i in miss_indices]
+                translated = self.translator.translate_batch(misses)
+                with self._cache_lock:
+                    cache = self._cache()
+                    for i, result in zip(miss_indices, translated, strict=True):
+                        results[i] = result
+                        if isinstance(result, str):
+                            cache.execute(
+                                'INSERT OR REPLACE INTO translations VALUES (?, ?)',
+                                (self._cache_key(texts[i]), result))
+                    cache.commit()
+            return results
+
+        max_workers = min(_MAX_WORKERS, len(texts))
+        if max_workers <= 1:
+            return [self.translate(text) if text else '' for text in texts]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda text: self.translate(text) if text else '', texts))
@@ -6,10 +6,12 @@ setup(
     packages=find_packages(),
     install_requires=[
         'PyMuPDF>=1.23.6',
-        'markdown2>=2.4.10',
         'googletrans==4.0.0-rc1',
         'grobid-client-python',
     ],
+    extras_require={
+        'cloud': ['google-cloud-translate>=3.11'],
+    },
     author='Felipe Felix Arias',
     author_email='felipefelixarias@gmail.com',
     description='English-Spanish Translation of Research Papers',
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import Mock, patch
 from MaroviTranslation.translation.core import Translator
@@ -15,6 +17,35 @@ class TestCore(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             trans.translate("Hello")
 
+    def test_translate_batch_falls_back_to_translate(self):
+        trans = Translator()
+        trans.cache_path = None  # keep the test off the on-disk cache
+        mock_trans = Mock(spec=["translate"])
+        mock_trans.translate.side_effect = lambda text: text.upper()
+        trans.set_translator(mock_trans)
+        self.assertEqual(trans.translate_batch(["hello", "", "world"]), ["HELLO", "", "WORLD"])
+
+    def test_translate_batch_delegates(self):
+        trans = Translator()
+        trans.cache_path = None  # keep the test off the on-disk cache
+        mock_trans = Mock()
+        mock_trans.translate_batch.return_value = ["Hola", "Mundo"]
+        trans.set_translator(mock_trans)
+        self.assertEqual(trans.translate_batch(["Hello", "World"]), ["Hola", "Mundo"])
+        mock_trans.translate_batch.assert_called_once_with(["Hello", "World"])
+
+    def test_translate_batch_uses_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            trans = Translator()
+            trans.cache_path = os.path.join(tmp, 'trans_cache.db')
+            mock_trans = Mock()
+            mock_trans.translate_batch.side_effect = lambda texts: [t.upper() for t in texts]
+            trans.set_translator(mock_trans)
+            self.assertEqual(trans.translate_batch(["hello", "world"]), ["HELLO", "WORLD"])
+            # Second run is served from the cache; only new texts hit the API
+            self.assertEqual(trans.translate_batch(["hello", "again"]), ["HELLO", "AGAIN"])
+            mock_trans.translate_batch.assert_called_with(["again"])
+
 
 class TestGoogleTranslation(unittest.TestCase):
     @patch('googletrans.Translator')